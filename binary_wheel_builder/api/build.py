@@ -3,12 +3,16 @@ Infrastructure to build deterministic wheels
 """
 import concurrent.futures
 import hashlib
+import io
+import json
+import mmap
 import os
 import pathlib
 from collections.abc import Generator
 from operator import attrgetter
 from pathlib import Path
 from binary_wheel_builder import wrapper_templates
+from binary_wheel_builder.__version__ import __version__
 from binary_wheel_builder.api.meta import (Wheel, WheelFileEntry, WheelPlatformBuildResult, WheelPlatformIdentifier,
                                            WheelSource)
 from binary_wheel_builder.wheel.reproducible import ReproducibleWheelFile
@@ -19,20 +23,120 @@ class WheelBuildException(Exception):
     pass
 
 
+_CACHE_FILE_NAME = ".cache.json"
+
+
+def _load_build_cache(dist_folder: Path) -> dict:
+    """
+    Load the cache keys of previous builds from the dist folder, an unreadable
+    or corrupt cache simply leads to a full rebuild
+    """
+    cache_file = dist_folder / _CACHE_FILE_NAME
+    try:
+        return json.loads(cache_file.read_text("utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _store_build_cache(dist_folder: Path, build_cache: dict) -> None:
+    cache_file = dist_folder / _CACHE_FILE_NAME
+    temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    temp_file.write_text(json.dumps(build_cache, indent=2, sort_keys=True), "utf-8")
+    os.replace(temp_file, cache_file)
+
+
+def _digest_stream(digest, stream) -> None:
+    """
+    Feed the full stream content into the digest, memory-mapping file backed streams
+    so the hash runs over the mapped pages without an intermediate copy per chunk
+    """
+    try:
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            digest.update(mapped)
+            return
+    except (ValueError, OSError, io.UnsupportedOperation):
+        # empty file or not a real file, fall back to chunked reading
+        pass
+
+    while chunk := stream.read(1024 * 1024):
+        digest.update(chunk)
+
+
+def _cache_key(tag: str, metadata_content: bytes, wheel_file_entries: list[WheelFileEntry]) -> str:
+    """
+    Build a content based cache key over everything that influences the wheel archive,
+    so unchanged inputs can skip the build entirely
+    """
+    digest = hashlib.sha256()
+    # the wrapper templates and archive layout may change between releases
+    digest.update(__version__.encode("utf-8"))
+    digest.update(tag.encode("utf-8"))
+    digest.update(metadata_content)
+
+    for entry in sorted(wheel_file_entries, key=attrgetter('path')):
+        digest.update(f"{entry.path}:{entry.permissions}:{entry.compress_type}".encode("utf-8"))
+        if entry.content_stream is not None:
+            with entry.content_stream() as stream:
+                _digest_stream(digest, stream)
+        else:
+            digest.update(entry.content)
+
+    return digest.hexdigest()
+
+
+def _generate_metadata_content(wheel_meta: Wheel) -> bytes:
+    """
+    Generate the METADATA file content, it is identical for every target platform
+    so it only needs to be rendered once per wheel
+    """
+    return generate_metadata_file(
+        wheel_meta.name,
+        wheel_meta.normalized_version,
+        wheel_meta.description,
+        **{
+            'Summary': wheel_meta.summary,
+            'Description-Content-Type': 'text/markdown',
+            'License': wheel_meta.license,
+            'Classifier': wheel_meta.classifier,
+            'Project-URL': wheel_meta.project_urls,
+            'Requires-Python': wheel_meta.requires_python,
+        },
+    )
+
+
+def _create_checksum_digest(checksum_algo: str):
+    """
+    Create a digest object for the wheel checksum.
+
+    blake3 is considerably faster than SHA256 for pure content fingerprinting,
+    but requires the optional blake3 package to be installed.
+    """
+    if checksum_algo == "sha256":
+        return hashlib.sha256()
+    if checksum_algo == "blake3":
+        try:
+            from blake3 import blake3
+        except ImportError as e:
+            raise WheelBuildException("blake3 is not installed, can not use it as checksum algorithm") from e
+        return blake3()
+    raise WheelBuildException(f"Unsupported checksum algorithm: {checksum_algo}")
+
+
 def _write_wheel(
         out_dir: str,
         wheel: Wheel,
         tag: str,
-        metadata: dict,
-        wheel_file_entries: list[WheelFileEntry]
-):
+        metadata_content: bytes,
+        wheel_file_entries: list[WheelFileEntry],
+        checksum_algo: str = "sha256"
+) -> tuple[pathlib.Path, str]:
     wheel_file_path = pathlib.Path(out_dir) / wheel.wheel_filename(tag)
 
     entries = [
         *wheel_file_entries,
         WheelFileEntry(
             path=f'{wheel.dist_info_folder}/METADATA',
-            content=generate_metadata_file(wheel.name, wheel.normalized_version, wheel.description, **metadata)
+            content=metadata_content
         ),
         WheelFileEntry(
             path=f'{wheel.dist_info_folder}/WHEEL',
@@ -40,20 +144,19 @@ def _write_wheel(
         )
     ]
 
-    with ReproducibleWheelFile(wheel_file_path, 'w') as wheel_file:
+    with ReproducibleWheelFile(wheel_file_path, 'w', checksum_digest=_create_checksum_digest(checksum_algo)) as wheel_file:
         for wheel_entry in sorted(entries, key=attrgetter('path')):
             wheel_file.write_content_file(wheel_entry)
 
-    return wheel_file_path
+    return wheel_file_path, wheel_file.checksum
 
 
-def _write_platform_wheel_with_wrappers(
-        out_dir: str,
-        wheel_info: Wheel,
-        platform: WheelPlatformIdentifier,
-        source: WheelSource
-):
-    contents = [
+def _build_common_wrappers(wheel_info: Wheel) -> list[WheelFileEntry]:
+    """
+    Build the wrapper file entries shared by every platform wheel,
+    their content only depends on the wheel metadata
+    """
+    entries = [
         WheelFileEntry(
             path=f'{wheel_info.package}/__init__.py',
             content=b''
@@ -69,36 +172,33 @@ def _write_platform_wheel_with_wrappers(
     ]
 
     if wheel_info.add_to_path:
-        contents.append(
+        entries.append(
             WheelFileEntry(
                 path=f'{wheel_info.dist_info_folder}/entry_points.txt',
                 content=wrapper_templates.entry_points_txt(wheel_info)
             )
         )
 
-    return _write_wheel(
-        out_dir=out_dir,
-        wheel=wheel_info,
-        tag=platform.to_tag(),
-        metadata={
-            'Summary': wheel_info.summary,
-            'Description-Content-Type': 'text/markdown',
-            'License': wheel_info.license,
-            'Classifier': wheel_info.classifier,
-            'Project-URL': wheel_info.project_urls,
-            'Requires-Python': wheel_info.requires_python,
-        },
-        wheel_file_entries=[
-            *contents,
-            # we append the package prefix to all generated files to make sure that they are in scope and reachable
-            *[
-                f.model_copy(update={'path': wheel_info.package + "/" + f.path})
-                for f in source.generate_fileset(platform)]
-        ],
-    )
+    return entries
 
 
-def build_wheel(wheel_meta: Wheel, dist_folder: Path, worker_count: int = 1) -> Generator[
+def _platform_wheel_entries(
+        wheel_info: Wheel,
+        platform: WheelPlatformIdentifier,
+        source: WheelSource,
+        common_entries: list[WheelFileEntry]
+) -> list[WheelFileEntry]:
+    return [
+        *common_entries,
+        # we append the package prefix to all generated files to make sure that they are in scope and reachable
+        *[
+            f.model_copy(update={'path': wheel_info.package + "/" + f.path})
+            for f in source.generate_fileset(platform)]
+    ]
+
+
+def build_wheel(wheel_meta: Wheel, dist_folder: Path, worker_count: int | None = None,
+                checksum_algo: str = "sha256") -> Generator[
     WheelPlatformBuildResult, None, None]:
     """
     Build a given wheel based on metadata and write all wheels to the dist folder.
@@ -107,19 +207,36 @@ def build_wheel(wheel_meta: Wheel, dist_folder: Path, worker_count: int = 1) ->
 
     :param wheel_meta: Metadata about wheel, used to construct the wheel archive for each platform.
     :param dist_folder: Path where all wheel files will be created
-    :param worker_count: Amount of workers to run wheel builds in parallel
+    :param worker_count: Amount of workers to run wheel builds in parallel,
+                         defaults to one worker per target platform so downloads and
+                         archive creation overlap across platforms
+    :param checksum_algo: Algorithm for the reported wheel checksum, either "sha256"
+                          (default) or "blake3" which is faster for plain content
+                          fingerprinting but requires the optional blake3 package
     :return: Yields for each generated platform wheel
     """
     dist_folder.mkdir(exist_ok=True)
 
-    worker_count = worker_count or os.cpu_count()
+    # fail fast on unknown algorithms or missing optional dependencies
+    _create_checksum_digest(checksum_algo)
+
+    worker_count = worker_count or len(wheel_meta.platforms) or os.cpu_count()
+    metadata_content = _generate_metadata_content(wheel_meta)
+    common_entries = _build_common_wrappers(wheel_meta)
+    wheel_meta.source.prefetch(wheel_meta.platforms)
+    build_cache = _load_build_cache(dist_folder)
+    updated_cache = dict(build_cache)
     with concurrent.futures.ProcessPoolExecutor(max_workers=worker_count) as executor:
         futures = [
             executor.submit(
                 _build_wheel_for_platform,
                 dist_folder,
                 python_platform,
-                wheel_meta
+                wheel_meta,
+                metadata_content,
+                common_entries,
+                build_cache,
+                checksum_algo
             )
             for python_platform in wheel_meta.platforms
         ]
@@ -131,24 +248,52 @@ def build_wheel(wheel_meta: Wheel, dist_folder: Path, worker_count: int = 1) ->
                 ) from future.exception()
 
             try:
-                yield future.result()
+                result, cache_entry = future.result()
+                updated_cache[Path(result.file_path).name] = cache_entry
             except Exception as e:
                 raise WheelBuildException("Unexpected error has occurred") from e
 
+            yield result
+
+    _store_build_cache(dist_folder, updated_cache)
 
-def _build_wheel_for_platform(dist_folder, python_platform, wheel_meta):
+
+def _build_wheel_for_platform(dist_folder, python_platform, wheel_meta, metadata_content, common_entries, build_cache,
+                              checksum_algo="sha256"):
     try:
-        wheel_path = _write_platform_wheel_with_wrappers(
-            dist_folder.__str__(),
+        tag = python_platform.to_tag()
+        wheel_filename = wheel_meta.wheel_filename(tag)
+        wheel_path = pathlib.Path(dist_folder.__str__()) / wheel_filename
+
+        entries = _platform_wheel_entries(
             wheel_meta,
             python_platform,
             wheel_meta.source,
+            common_entries,
         )
-        with open(wheel_path, 'rb') as wheel:
+
+        cache_key = _cache_key(tag, metadata_content, entries)
+        cached = build_cache.get(wheel_filename)
+        if cached is not None and cached.get("key") == cache_key and cached.get("algo") == checksum_algo \
+                and wheel_path.is_file():
+            # all inputs are byte-identical to the existing wheel, skip the build
             return WheelPlatformBuildResult(
-                checksum=hashlib.sha256(wheel.read()).hexdigest(),
+                checksum=cached["checksum"],
                 file_path=wheel_path,
-            )
+            ), cached
+
+        wheel_path, checksum = _write_wheel(
+            out_dir=dist_folder.__str__(),
+            wheel=wheel_meta,
+            tag=tag,
+            metadata_content=metadata_content,
+            wheel_file_entries=entries,
+            checksum_algo=checksum_algo,
+        )
+        return WheelPlatformBuildResult(
+            checksum=checksum,
+            file_path=wheel_path,
+        ), {"key": cache_key, "checksum": checksum, "algo": checksum_algo}
     except (OSError, IOError) as e:
         raise RuntimeError(f"File operation failed for platform {python_platform}") from e
     except Exception as e:
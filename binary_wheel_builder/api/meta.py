@@ -5,7 +5,8 @@ import functools
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from pathlib import Path
-from typing import Any, Callable
+from typing import IO, Any, Callable
+from zipfile import ZIP_DEFLATED
 
 from pydantic import BaseModel, ConfigDict, Field, GetJsonSchemaHandler, dataclasses
 from pydantic.json_schema import JsonSchemaValue
@@ -17,7 +18,7 @@ class WheelPlatformBuildResult:
     """Result of a wheel file build"""
 
     checksum: str
-    """Contains the SHA256 checksum of the created wheel file"""
+    """Contains the checksum of the created wheel file, SHA256 unless another algorithm was requested"""
 
     file_path: Path
     """Full qualified path to wheel"""
@@ -56,12 +57,23 @@ class WheelFileEntry(BaseModel):
     path: str = Field(description="Path of the file in the wheel")
     """Path of the file in the wheel"""
 
-    content: bytes = Field(description="Binary content for the file")
+    content: bytes = Field(b'', description="Binary content for the file")
     """Binary content for the file"""
 
+    content_stream: Callable[[], IO[bytes]] | None = Field(
+        None,
+        description="Factory opening a binary stream with the file content, "
+                    "takes precedence over content and avoids buffering large files in memory"
+    )
+    """Factory opening a binary stream with the file content,
+    takes precedence over content and avoids buffering large files in memory"""
+
     permissions: int = Field(0o644, description="Permissions for the file in the archive")
     """Permissions for the file in the archive"""
 
+    compress_type: int = Field(ZIP_DEFLATED, description="Zip compression method for the file in the archive")
+    """Zip compression method for the file in the archive, use ZIP_STORED for content that is already compressed"""
+
 
 class WheelSource(ABC):
     """
@@ -77,6 +89,15 @@ class WheelSource(ABC):
         """
         return []
 
+    def prefetch(self, wheel_platforms: Sequence[WheelPlatformIdentifier]) -> None:
+        """
+        Fetch remote data for the given platforms ahead of building the wheels.
+
+        Sources backed by the network may override this to download assets for all
+        platforms concurrently, the default does nothing.
+        :param wheel_platforms: Platforms the wheels will be built for
+        """
+
     @classmethod
     def __get_pydantic_json_schema__(
             cls, core_schema: core_schema.JsonSchema, handler: GetJsonSchemaHandler
@@ -1,15 +1,61 @@
 """
 Sources for GitHub
 """
+import concurrent.futures
+import os
+from collections.abc import Sequence
+from pathlib import Path
 from urllib.error import HTTPError
+from zipfile import ZIP_DEFLATED, ZIP_STORED
 
 from binary_wheel_builder.api.meta import WheelFileEntry, WheelPlatformIdentifier, WheelSource
 from binary_wheel_builder.api.wheel_sources.exceptions import SourceFileRequestFailed, UnsupportedWheelPlatformException
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_client = None
+
+
+def _shared_client() -> "httpx.Client":
+    """
+    Lazily create a module level httpx client, so the TCP connection and TLS handshake
+    are amortized across all asset downloads from the same host
+    """
+    global _client
+    if _client is None:
+        _client = httpx.Client(follow_redirects=True)
+    return _client
+
+
+def _cache_root() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "binary_wheel_builder"
+
+
+_COMPRESSED_ASSET_SUFFIXES = (".gz", ".tgz", ".zip", ".xz", ".txz", ".bz2", ".zst", ".7z")
+
+
+def _asset_compress_type(asset_name: str) -> int:
+    """
+    Deflating an already compressed release asset burns CPU for near zero size reduction,
+    so such assets are stored uncompressed in the wheel archive
+    """
+    if asset_name.lower().endswith(_COMPRESSED_ASSET_SUFFIXES):
+        return ZIP_STORED
+    return ZIP_DEFLATED
+
 
 class GithubReleaseBinarySource(WheelSource):
     """
     Provide source from GitHub Release API
+
+    When the optional httpx package is installed, downloads share a pooled client with
+    keep-alive connections instead of opening a fresh connection per asset.
+
+    Downloaded assets are cached below the user cache directory keyed by project slug,
+    version and asset name, so repeated builds of the same release skip the download.
     """
     def __init__(
             self,
@@ -19,6 +65,7 @@ class GithubReleaseBinarySource(WheelSource):
             binary_path: str,
             tag_prefix: str = "v",
             token: str | None = None,
+            use_cache: bool = True,
     ):
         """
         :param project_slug: Full name of the project e.g. user/project or org/project
@@ -27,6 +74,8 @@ class GithubReleaseBinarySource(WheelSource):
         :param binary_path: Path to the binary file in the generated wheel
         :param tag_prefix: Prefix for release tag which will be prepended to version for the version
         :param token: Optional token in case you want to access a private repository
+        :param use_cache: Cache downloaded release assets on disk, release assets are
+                          immutable per tag so rebuilds skip the download entirely
         """
         self.project_slug = project_slug
         self.version = version
@@ -34,15 +83,22 @@ class GithubReleaseBinarySource(WheelSource):
         self.binary_path = binary_path
         self.tag_prefix = tag_prefix
         self.token = token
+        self.use_cache = use_cache
 
-    def generate_fileset(self, wheel_platform: WheelPlatformIdentifier) -> list[WheelFileEntry]:
-        from urllib.request import urlopen, Request
+    def _download_asset(self, url: str) -> bytes:
+        if httpx is not None:
+            try:
+                response = _shared_client().get(
+                    url,
+                    headers={"Authorization": f"token {self.token}"} if self.token is not None else None
+                )
+                response.raise_for_status()
+                return response.content
+            except httpx.HTTPError as e:
+                raise SourceFileRequestFailed("Failed to fetch file: " + str(e)) from e
 
-        if wheel_platform not in self.asset_name_mapping:
-            raise UnsupportedWheelPlatformException(wheel_platform)
+        from urllib.request import urlopen, Request
 
-        url = (f"https://github.com/{self.project_slug}"
-               f"/releases/download/{self.tag_prefix}{self.version}/{self.asset_name_mapping[wheel_platform]}")
         request = Request(url)
 
         if self.token is not None:
@@ -50,14 +106,79 @@ class GithubReleaseBinarySource(WheelSource):
 
         try:
             with urlopen(request) as response:
-                file_content = response.read()
+                return response.read()
         except HTTPError as e:
             raise SourceFileRequestFailed("Failed to fetch file: " + str(e)) from e
 
+    def _asset_url(self, asset_name: str) -> str:
+        return (f"https://github.com/{self.project_slug}"
+                f"/releases/download/{self.tag_prefix}{self.version}/{asset_name}")
+
+    def _cached_asset_path(self, asset_name: str) -> Path:
+        return _cache_root() / self.project_slug / self.version / asset_name
+
+    def _ensure_cached_asset(self, asset_name: str) -> Path:
+        """
+        Make sure the release asset is present in the on disk cache and return its path
+        """
+        cache_path = self._cached_asset_path(asset_name)
+        if cache_path.is_file():
+            return cache_path
+
+        file_content = self._download_asset(self._asset_url(asset_name))
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(file_content)
+        os.replace(temp_path, cache_path)
+
+        return cache_path
+
+    def prefetch(self, wheel_platforms: Sequence[WheelPlatformIdentifier]) -> None:
+        """
+        Download the release assets for all given platforms concurrently into the disk
+        cache, so the per-platform builds only read from disk. Downloads are
+        latency-bound, running them in parallel overlaps the round trips.
+        """
+        if not self.use_cache:
+            return
+
+        missing = [
+            self.asset_name_mapping[wheel_platform]
+            for wheel_platform in wheel_platforms
+            if wheel_platform in self.asset_name_mapping
+               and not self._cached_asset_path(self.asset_name_mapping[wheel_platform]).is_file()
+        ]
+        if not missing:
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            for future in [executor.submit(self._ensure_cached_asset, asset_name) for asset_name in missing]:
+                future.result()
+
+    def generate_fileset(self, wheel_platform: WheelPlatformIdentifier) -> list[WheelFileEntry]:
+        if wheel_platform not in self.asset_name_mapping:
+            raise UnsupportedWheelPlatformException(wheel_platform)
+
+        asset_name = self.asset_name_mapping[wheel_platform]
+
+        if self.use_cache:
+            # stream from the cache file, so the binary is never held in memory as a whole
+            cache_path = self._ensure_cached_asset(asset_name)
+            return [
+                WheelFileEntry(
+                    path=self.binary_path,
+                    content_stream=lambda: cache_path.open("rb"),
+                    permissions=0o755,
+                    compress_type=_asset_compress_type(asset_name)
+                )
+            ]
+
         return [
             WheelFileEntry(
                 path=self.binary_path,
-                content=file_content,
-                permissions=0o755
+                content=self._download_asset(self._asset_url(asset_name)),
+                permissions=0o755,
+                compress_type=_asset_compress_type(asset_name)
             )
         ]
@@ -1,3 +1,6 @@
+import os
+import tempfile
+from pathlib import Path
 from unittest import mock
 from unittest.mock import patch, MagicMock
 from urllib.error import HTTPError
@@ -5,7 +8,7 @@ from urllib.error import HTTPError
 import pytest
 
 from binary_wheel_builder.api import well_known_platforms
-from binary_wheel_builder.api.wheel_sources import GithubReleaseBinarySource
+from binary_wheel_builder.api.wheel_sources import GithubReleaseBinarySource, github
 from binary_wheel_builder.api.wheel_sources.exceptions import WheelSourceException
 
 
@@ -18,7 +21,8 @@ from binary_wheel_builder.api.wheel_sources.exceptions import WheelSourceExcepti
 ])
 def test_github_release_binary_wheel_source(tag_prefix: str, status_code: int):
     request_fail = True if status_code < 200 or status_code > 300 else False
-    with mock.patch("urllib.request.urlopen",
+    with mock.patch.object(github, "httpx", None), \
+            mock.patch("urllib.request.urlopen",
                     return_value=MagicMock(return_value=None),
                     side_effect=HTTPError('http://example.com', status_code, 'status', {},
                                           None) if request_fail else None) as urlopen_mock:
@@ -39,3 +43,131 @@ def test_github_release_binary_wheel_source(tag_prefix: str, status_code: int):
             urlopen_mock.read.assert_called_once()
 
         urlopen_mock.assert_called_once()
+
+
+def test_github_release_binary_wheel_source_cache_hit():
+    with tempfile.TemporaryDirectory() as cache_dir, \
+            mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_dir}), \
+            mock.patch.object(github, "httpx", None), \
+            mock.patch("urllib.request.urlopen") as urlopen_mock:
+        cache_file = Path(cache_dir, "binary_wheel_builder", "org", "project", "0.0.1", "foo-bar")
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_bytes(b"cached binary")
+
+        source = GithubReleaseBinarySource(
+            "org/project",
+            "0.0.1", {
+                well_known_platforms.LINUX_GENERIC_i386: "foo-bar"
+            },
+            "foo-bar"
+        )
+        entries = source.generate_fileset(well_known_platforms.LINUX_GENERIC_i386)
+
+        with entries[0].content_stream() as stream:
+            assert stream.read() == b"cached binary"
+        urlopen_mock.assert_not_called()
+
+
+def test_github_release_binary_wheel_source_prefetch():
+    with tempfile.TemporaryDirectory() as cache_dir, \
+            mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_dir}), \
+            mock.patch.object(github, "httpx", None), \
+            mock.patch("urllib.request.urlopen") as urlopen_mock:
+        urlopen_mock.return_value.__enter__.return_value.read.return_value = b"downloaded binary"
+
+        source = GithubReleaseBinarySource(
+            "org/project",
+            "0.0.1", {
+                well_known_platforms.LINUX_GENERIC_i386: "foo-bar-i386",
+                well_known_platforms.LINUX_GENERIC_x86_64: "foo-bar-x86_64"
+            },
+            "foo-bar"
+        )
+        source.prefetch([
+            well_known_platforms.LINUX_GENERIC_i386,
+            well_known_platforms.LINUX_GENERIC_x86_64
+        ])
+
+        assert urlopen_mock.call_count == 2
+        for asset_name in ["foo-bar-i386", "foo-bar-x86_64"]:
+            cache_file = Path(cache_dir, "binary_wheel_builder", "org", "project", "0.0.1", asset_name)
+            assert cache_file.read_bytes() == b"downloaded binary"
+
+        # assets are cached now, so building the fileset does not hit the network again
+        source.generate_fileset(well_known_platforms.LINUX_GENERIC_i386)
+        assert urlopen_mock.call_count == 2
+
+
+def test_github_release_binary_wheel_source_populates_cache():
+    with tempfile.TemporaryDirectory() as cache_dir, \
+            mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache_dir}), \
+            mock.patch.object(github, "httpx", None), \
+            mock.patch("urllib.request.urlopen") as urlopen_mock:
+        urlopen_mock.return_value.__enter__.return_value.read.return_value = b"downloaded binary"
+
+        source = GithubReleaseBinarySource(
+            "org/project",
+            "0.0.1", {
+                well_known_platforms.LINUX_GENERIC_i386: "foo-bar"
+            },
+            "foo-bar"
+        )
+        entries = source.generate_fileset(well_known_platforms.LINUX_GENERIC_i386)
+
+        with entries[0].content_stream() as stream:
+            assert stream.read() == b"downloaded binary"
+        cache_file = Path(cache_dir, "binary_wheel_builder", "org", "project", "0.0.1", "foo-bar")
+        assert cache_file.read_bytes() == b"downloaded binary"
+
+
+def _httpx_module_mock() -> MagicMock:
+    httpx_mock = MagicMock()
+    httpx_mock.HTTPError = type("HTTPError", (Exception,), {})
+    return httpx_mock
+
+
+def test_github_release_binary_wheel_source_httpx():
+    client_mock = MagicMock()
+    client_mock.get.return_value.content = b"downloaded binary"
+    with mock.patch.object(github, "httpx", _httpx_module_mock()), \
+            mock.patch.object(github, "_client", client_mock):
+        source = GithubReleaseBinarySource(
+            "org/project",
+            "0.0.1", {
+                well_known_platforms.LINUX_GENERIC_i386: "foo-bar"
+            },
+            "foo-bar",
+            token="secret-token",
+            use_cache=False
+        )
+        entries = source.generate_fileset(well_known_platforms.LINUX_GENERIC_i386)
+
+        assert entries[0].content == b"downloaded binary"
+        client_mock.get.assert_called_once_with(
+            "https://github.com/org/project/releases/download/v0.0.1/foo-bar",
+            headers={"Authorization": "token secret-token"}
+        )
+        client_mock.get.return_value.raise_for_status.assert_called_once()
+
+
+def test_github_release_binary_wheel_source_httpx_error():
+    httpx_mock = _httpx_module_mock()
+    client_mock = MagicMock()
+    client_mock.get.return_value.raise_for_status.side_effect = httpx_mock.HTTPError("404 Not Found")
+    with mock.patch.object(github, "httpx", httpx_mock), \
+            mock.patch.object(github, "_client", client_mock):
+        source = GithubReleaseBinarySource(
+            "org/project",
+            "0.0.1", {
+                well_known_platforms.LINUX_GENERIC_i386: "foo-bar"
+            },
+            "foo-bar",
+            use_cache=False
+        )
+
+        with pytest.raises(WheelSourceException):
+            source.generate_fileset(well_known_platforms.LINUX_GENERIC_i386)
+        client_mock.get.assert_called_once_with(
+            "https://github.com/org/project/releases/download/v0.0.1/foo-bar",
+            headers=None
+        )
@@ -29,6 +29,12 @@ def _parse_args(args) -> Namespace:
         type=int,
         help="Number of parallel workers to use at most for building wheels"
     )
+    parser.add_argument(
+        "--checksum-algo",
+        default="sha256",
+        choices=["sha256", "blake3"],
+        help="Algorithm for the reported wheel checksums, blake3 requires the optional blake3 package"
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -63,7 +69,7 @@ def main(argv=None) -> None:
         raise SystemExit(f"Failed to load wheel spec from '{args.wheel_spec}': {e}")
 
     try:
-        for result in build_wheel(wheel, dist_path, worker_count=args.max_workers):
+        for result in build_wheel(wheel, dist_path, worker_count=args.max_workers, checksum_algo=args.checksum_algo):
             print(f"> {result.checksum} - {result.file_path}")
     except Exception as e:
         raise SystemExit(f"Error occurred while building wheels: {e}")
@@ -66,7 +66,14 @@ def _construct_wheel_platform_identifier(loader: yaml.SafeLoader,
     return WheelPlatformIdentifier(**kwargs)
 
 
-class YamlSafeLoaderWithFileContext(yaml.SafeLoader):
+try:
+    # libyaml moves tokenizing and parsing into C, roughly an order of magnitude faster
+    from yaml import CSafeLoader as _SafeLoaderBase
+except ImportError:
+    from yaml import SafeLoader as _SafeLoaderBase
+
+
+class YamlSafeLoaderWithFileContext(_SafeLoaderBase):
     file_path: Path
 
 
@@ -1,24 +1,141 @@
+import hashlib
+import io
+import os
 import stat
-from zipfile import ZipInfo, ZIP_DEFLATED
+from typing import Callable, IO
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED
 
-from wheel.wheelfile import WheelFile
+from wheel.wheelfile import WheelFile, urlsafe_b64encode
 
 from binary_wheel_builder.api.meta import WheelFileEntry
 
 
+class _HashingFileProxy:
+    """
+    File object wrapper feeding every byte that ends up in the wrapped file into a digest,
+    so the archive checksum is known once the file is closed without hashing it from scratch.
+
+    zipfile seeks back to patch the local file header once an entry is finalized, so bytes
+    can not be hashed while they are written. Once the writer seeks past the end of
+    everything written so far, the now final region is read back chunk-wise through a
+    separate read handle (usually straight from the page cache) and fed to the digest,
+    so memory usage stays flat no matter how large a single entry is.
+    """
+
+    def __init__(self, raw, digest, reader):
+        self._raw = raw
+        self._digest = digest
+        self._reader = reader
+        self._committed = 0  # number of bytes already fed into the digest
+        self._position = raw.tell()
+        self._end = self._position
+
+    def _commit_pending(self) -> None:
+        if self._committed == self._end:
+            return
+        self._raw.flush()
+        self._reader.seek(self._committed)
+        while self._committed < self._end:
+            chunk = self._reader.read(min(1024 * 1024, self._end - self._committed))
+            if not chunk:
+                raise ValueError("Output file ends before all written bytes could be hashed")
+            self._digest.update(chunk)
+            self._committed += len(chunk)
+
+    def write(self, data) -> int:
+        if self._position < self._committed:
+            raise ValueError("Can not rewrite bytes that were already hashed")
+        written = self._raw.write(data)
+        self._position += written
+        self._end = max(self._end, self._position)
+        return written
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        self._position = self._raw.seek(offset, whence)
+        if self._position == self._end:
+            # the writer moved past all pending bytes, they are final now
+            self._commit_pending()
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        self._commit_pending()
+        self._reader.close()
+        self._raw.close()
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+
 class ReproducibleWheelFile(WheelFile):
+    def __init__(self, file, mode="r", compression=ZIP_DEFLATED, checksum_digest=None):
+        """
+        :param checksum_digest: Digest object accumulating the written archive bytes,
+                                defaults to a fresh SHA256 one
+        """
+        super().__init__(file, mode, compression)
+        self._checksum = checksum_digest if checksum_digest is not None else hashlib.sha256()
+        if mode == "w":
+            # enlarge the write buffer, so the many small zip headers and entries
+            # coalesce into few write syscalls instead of roughly three per entry
+            buffered = io.BufferedWriter(self.fp.detach(), buffer_size=1024 * 1024)
+            self.fp = _HashingFileProxy(buffered, self._checksum, open(self.filename, "rb"))
+
+    @property
+    def checksum(self) -> str:
+        """Hex encoded digest of the written archive (SHA256 by default), available once the file is closed"""
+        return self._checksum.hexdigest()
+
     def write_content_file(self, wheel_entry: WheelFileEntry) -> None:
         zip_info = ZipInfo(wheel_entry.path)
         zip_info.external_attr = (wheel_entry.permissions | stat.S_IFREG) << 16
-        zip_info.file_size = len(wheel_entry.content)
+        zip_info.compress_type = wheel_entry.compress_type
         zip_info.create_system = 3
+
+        if wheel_entry.content_stream is not None:
+            self._write_streamed_file(zip_info, wheel_entry.content_stream)
+            return
+
+        zip_info.file_size = len(wheel_entry.content)
         self.writestr(zip_info, data=wheel_entry.content)
 
+    def _write_streamed_file(self, zip_info: ZipInfo, content_stream: Callable[[], IO[bytes]]) -> None:
+        """
+        Copy a stream into the archive chunk-wise, so large files never have to be
+        buffered in memory as a whole
+        """
+        zip_info.date_time = (1980, 1, 1, 0, 0, 0)
+        file_hash = self._default_algorithm()
+        file_size = 0
+
+        with content_stream() as source:
+            try:
+                # size the entry upfront, so zipfile only switches to zip64 headers when
+                # actually needed and the output stays byte-identical to the writestr path
+                zip_info.file_size = os.fstat(source.fileno()).st_size
+            except (OSError, io.UnsupportedOperation, AttributeError):
+                pass
+
+            with ZipFile.open(self, zip_info, mode='w') as target:
+                while chunk := source.read(1024 * 1024):
+                    target.write(chunk)
+                    file_hash.update(chunk)
+                    file_size += len(chunk)
+
+        # writestr is bypassed here, so register the entry for RECORD generation manually
+        self._file_hashes[zip_info.filename] = (
+            file_hash.name,
+            urlsafe_b64encode(file_hash.digest()).decode("ascii"),
+        )
+        self._file_sizes[zip_info.filename] = file_size
+
     def writestr(self, zip_info: ZipInfo | str, *args, **kwargs):
         if isinstance(zip_info, str):
             zip_info = ZipInfo(zip_info)
             zip_info.external_attr = (0o644 | stat.S_IFREG) << 16
-        zip_info.compress_type = ZIP_DEFLATED
+            zip_info.compress_type = ZIP_DEFLATED
         zip_info.date_time = (1980, 1, 1, 0, 0, 0)
         zip_info.create_system = 3
         super().writestr(zip_info, *args, **kwargs)
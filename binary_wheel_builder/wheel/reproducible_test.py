@@ -1,6 +1,7 @@
 import hashlib
 import os
 import tempfile
+import zipfile
 from pathlib import Path
 
 from binary_wheel_builder.api.meta import WheelFileEntry
@@ -20,3 +21,116 @@ def test_reproducible_wheel_zipfile():
         actual_hash = hashlib.sha256(fp.read()).hexdigest()
     os.unlink(f)
     assert "f4873928fe1f041339ee38dacb30af0e4f1c3b5824d00316352d58679b42901a" == actual_hash
+
+
+def test_write_content_file_respects_compress_type():
+    f = tempfile.mkdtemp() + "/wheel-0.0.1-py3-none-any.whl"
+    zip = ReproducibleWheelFile(Path(f), "w")
+    zip.write_content_file(WheelFileEntry(
+        path="stored.bin",
+        content=b"already compressed payload",
+        permissions=0o755,
+        compress_type=zipfile.ZIP_STORED
+    ))
+    zip.write_content_file(WheelFileEntry(
+        path="deflated.txt",
+        content=b"Hello World",
+        permissions=0o644
+    ))
+    zip.close()
+    with zipfile.ZipFile(f) as archive:
+        assert archive.getinfo("stored.bin").compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("deflated.txt").compress_type == zipfile.ZIP_DEFLATED
+        assert archive.read("stored.bin") == b"already compressed payload"
+    os.unlink(f)
+
+
+def test_write_content_file_streamed():
+    temp_dir = tempfile.mkdtemp()
+    payload = b"streamed binary payload" * 1000
+    source_path = Path(temp_dir, "binary")
+    source_path.write_bytes(payload)
+
+    f = temp_dir + "/wheel-0.0.1-py3-none-any.whl"
+    zip = ReproducibleWheelFile(Path(f), "w")
+    zip.write_content_file(WheelFileEntry(
+        path="wheel/binary",
+        content_stream=lambda: source_path.open("rb"),
+        permissions=0o755
+    ))
+    zip.close()
+
+    with zipfile.ZipFile(f) as archive:
+        assert archive.read("wheel/binary") == payload
+        record = archive.read("wheel-0.0.1.dist-info/RECORD").decode("utf-8")
+
+    record_entry = next(line for line in record.splitlines() if line.startswith("wheel/binary,"))
+    assert record_entry.endswith(f",{len(payload)}")
+    assert "sha256=" in record_entry
+
+    with open(f, "rb") as fp:
+        assert zip.checksum == hashlib.sha256(fp.read()).hexdigest()
+    os.unlink(f)
+
+
+def test_streamed_and_buffered_writes_are_byte_identical():
+    temp_dir = tempfile.mkdtemp()
+    payload = b"streamed binary payload" * 1000
+    source_path = Path(temp_dir, "binary")
+    source_path.write_bytes(payload)
+
+    streamed_file = Path(temp_dir, "streamed", "wheel-0.0.1-py3-none-any.whl")
+    buffered_file = Path(temp_dir, "buffered", "wheel-0.0.1-py3-none-any.whl")
+    for out_file, entry in [
+        (streamed_file, WheelFileEntry(
+            path="wheel/binary",
+            content_stream=lambda: source_path.open("rb"),
+            permissions=0o755
+        )),
+        (buffered_file, WheelFileEntry(
+            path="wheel/binary",
+            content=payload,
+            permissions=0o755
+        )),
+    ]:
+        out_file.parent.mkdir()
+        zip = ReproducibleWheelFile(out_file, "w")
+        zip.write_content_file(entry)
+        zip.close()
+
+    # whether an entry was streamed or buffered must not leak into the archive bytes
+    assert streamed_file.read_bytes() == buffered_file.read_bytes()
+    os.unlink(streamed_file)
+    os.unlink(buffered_file)
+
+
+def test_hashing_proxy_commits_finalized_entries():
+    f = tempfile.mkdtemp() + "/wheel-0.0.1-py3-none-any.whl"
+    zip = ReproducibleWheelFile(Path(f), "w")
+    zip.write_content_file(WheelFileEntry(
+        path="large.bin",
+        content=os.urandom(2 * 1024 * 1024),
+        permissions=0o644
+    ))
+    # the finalized entry is hashed right away, nothing accumulates until close
+    assert zip.fp._committed == zip.fp._end > 0
+    zip.close()
+    with open(f, "rb") as fp:
+        assert zip.checksum == hashlib.sha256(fp.read()).hexdigest()
+    os.unlink(f)
+
+
+def test_streamed_checksum_matches_file_content():
+    f = tempfile.mkdtemp() + "/wheel-0.0.1-py3-none-any.whl"
+    zip = ReproducibleWheelFile(Path(f), "w")
+    for index in range(3):
+        zip.write_content_file(WheelFileEntry(
+            path=f"test-{index}.txt",
+            content=f"Hello World {index}".encode("utf-8") * 1000,
+            permissions=0o644
+        ))
+    zip.close()
+    with open(f, "rb") as fp:
+        actual_hash = hashlib.sha256(fp.read()).hexdigest()
+    os.unlink(f)
+    assert zip.checksum == actual_hash
@@ -1,6 +1,8 @@
+import functools
 from email.message import EmailMessage
 
 
+@functools.lru_cache(maxsize=None)
 def generate_wheel_file(tag: str):
     return generate_metafile_content({
         'Wheel-Version': '1.0',
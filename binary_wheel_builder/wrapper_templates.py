@@ -1,6 +1,7 @@
 """
 Wrapper templates for generating packages
 """
+import functools
 import textwrap
 
 from binary_wheel_builder.api.meta import Wheel
@@ -11,26 +12,41 @@ def _preprocess(val: str):
 
 
 def module_main(wheel: Wheel):
+    return _render_module_main(wheel.executable)
+
+
+def exec_util(wheel: Wheel):
+    return _render_exec_util(wheel.executable)
+
+
+def entry_points_txt(wheel: Wheel):
+    return _render_entry_points_txt(wheel.executable, wheel.package)
+
+
+@functools.lru_cache(maxsize=None)
+def _render_module_main(executable: str):
     # language=python
     return _preprocess(
         f'''\
         import os, sys, subprocess
         sys.exit(subprocess.call([
-            os.path.join(os.path.dirname(__file__), "{wheel.executable}"),
+            os.path.join(os.path.dirname(__file__), "{executable}"),
             *sys.argv[1:]
         ]))
         '''
     )
 
 
-def exec_util(wheel: Wheel):
+@functools.lru_cache(maxsize=None)
+def _render_exec_util(executable: str):
     # language=python
     return _preprocess(
         f'''\
         from dataclasses import dataclass
         import subprocess
         import os
-        from string import Template
+        import re
+        import threading
 
 
         @dataclass(frozen=True)
@@ -42,22 +58,22 @@ def exec_util(wheel: Wheel):
 
         def create_subprocess(args: list[str], stdout: int, stderr: int, stdin: int | None = None, cwd=None, env=None) -> subprocess.Popen:
             """
-            Create subprocess for {wheel.executable} with the specified arguments
+            Create subprocess for {executable} with the specified arguments
 
-            :param args: Arguments to pass to {wheel.executable}
+            :param args: Arguments to pass to {executable}
             :param stdout: Stdout channel
             :param stderr: Stderr channel
             :param cwd: PWD for subprocess
             :param env: Environment variables for subprocess
             """
-            return subprocess.Popen([os.path.join(os.path.dirname(__file__), "{wheel.executable}"), *args], stdout=stdout, stderr=stderr, stdin=stdin, cwd=cwd, text=True)
+            return subprocess.Popen([os.path.join(os.path.dirname(__file__), "{executable}"), *args], stdout=stdout, stderr=stderr, stdin=stdin, cwd=cwd, text=True)
 
 
         def exec_silently(args: list[str], timeout: int = -1) -> subprocess.Popen:
             """
-            Execute {wheel.executable} silently with given arguments
+            Execute {executable} silently with given arguments
 
-            :param args: Arguments to pass to {wheel.executable}
+            :param args: Arguments to pass to {executable}
             :param timeout: Timeout in ms
             :return: Completed Popen object
             """
@@ -69,12 +85,24 @@ def exec_util(wheel: Wheel):
             return process
 
 
+        def _pump_output(stream, line_format: str, capture_output: bool, captured_lines: list) -> None:
+            # split the format once instead of re-parsing it per line, joining afterwards also
+            # never substitutes into output that happens to contain a placeholder itself
+            format_parts = re.split(r"\$\{{line\}}|\$line", line_format)
+            for line in stream:
+                formatted_line = line.rstrip().join(format_parts)
+                if capture_output:
+                    captured_lines.append(formatted_line)
+                else:
+                    print(formatted_line)
+
+
         def exec_with_templated_output(args: list[str],
                                       capture_output: bool = False,
                                       stdout_format: str = "[STDOUT] $line",
                                       stderr_format: str = "[STDERR] $line") -> ExecWithPrefixedOutputResult:
             """
-            Run {wheel.executable} using the specified args with templated stdout and stderr.
+            Run {executable} using the specified args with templated stdout and stderr.
 
 
             This utility is especially helpful when you want to use the python package as wrapper around a tool that runs
@@ -84,45 +112,34 @@ def exec_util(wheel: Wheel):
             To customize the format of the stdout and stderr, customize the *_format parameters.
 
             Following variables are available:
-                - *$line*: Captured output line with removed trailing linebreak or whitespace
-            :param args: Arguments to pass to {wheel.executable}
+                - *$line* (also as *${{line}}*): Captured output line with removed trailing linebreak or whitespace
+            :param args: Arguments to pass to {executable}
             :param capture_output: Capture the output in the result instead of printing it to stdout
             :param stdout_format: Format string for the stdout
             :param stderr_format: Format string for the stderr.
             :return:
             """
 
-            stderr_buffer = ""
-            stdout_buffer = ""
-
             process = create_subprocess(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
-            stdout_template = Template(stdout_format)
-            stderr_template = Template(stderr_format)
-
-            while True:
-                output_stdout = process.stdout.readline()
-                output_stderr = process.stderr.readline()
+            stdout_lines = []
+            stderr_lines = []
 
-                if output_stdout == '' and output_stderr == '' and process.poll() is not None:
-                    break
-
-                if output_stdout:
-                    stdout_buffer_line = stdout_template.safe_substitute(line=output_stdout.rstrip())
-                    if capture_output:
-                        stdout_buffer += stdout_buffer_line + "\\n"
-                    else:
-                        print(stdout_buffer_line)
-
-                if output_stderr:
-                    stderr_buffer_line = stderr_template.safe_substitute(line=output_stderr.rstrip())
-                    if capture_output:
-                        stderr_buffer += stderr_buffer_line + "\\n"
-                    else:
-                        print(stderr_buffer_line)
+            # one reader thread per pipe avoids head-of-line blocking between the channels
+            readers = [
+                threading.Thread(target=_pump_output, args=(process.stdout, stdout_format, capture_output, stdout_lines)),
+                threading.Thread(target=_pump_output, args=(process.stderr, stderr_format, capture_output, stderr_lines)),
+            ]
+            for reader in readers:
+                reader.start()
+            for reader in readers:
+                reader.join()
 
             process.wait()
 
+            stdout_buffer = "".join(line + "\\n" for line in stdout_lines)
+            stderr_buffer = "".join(line + "\\n" for line in stderr_lines)
+
             return ExecWithPrefixedOutputResult(
                 exit_code=process.returncode,
                 stdout_buffer=stdout_buffer if stdout_buffer != "" else None,
@@ -133,10 +150,11 @@ def exec_util(wheel: Wheel):
     )
 
 
-def entry_points_txt(wheel: Wheel):
+@functools.lru_cache(maxsize=None)
+def _render_entry_points_txt(executable: str, package: str):
     return _preprocess(
         f'''\
         [console_scripts]
-        {wheel.executable}={wheel.package}:__main__
+        {executable}={package}:__main__
         '''
     )
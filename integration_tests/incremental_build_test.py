@@ -0,0 +1,85 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from binary_wheel_builder import Wheel, build_wheel
+from binary_wheel_builder import well_known_platforms
+from binary_wheel_builder.api.wheel_sources import StaticLocalWheelSource
+
+
+class IncrementalBuildTest(unittest.TestCase):
+    def _wheel_meta(self, source_file: Path) -> Wheel:
+        return Wheel(
+            package="dummy",
+            executable="dummy",
+            name="dummy",
+            version="0.0.1",
+            summary='Dummy is showcasing how it could look like',
+            license='MIT',
+            source=StaticLocalWheelSource(source_file),
+            platforms=[
+                well_known_platforms.LINUX_GENERIC_x86_64,
+            ],
+            add_to_path=False,
+        )
+
+    def test_rebuild_with_unchanged_inputs_skips_write(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_file = Path(temp_dir, "dummy")
+            source_file.write_bytes(b"#!/bin/sh\necho dummy\n")
+            dist_path = Path(temp_dir, "dist")
+
+            first = list(build_wheel(self._wheel_meta(source_file), dist_path))[0]
+            self.assertTrue(Path(dist_path, ".cache.json").is_file())
+            first_mtime = Path(first.file_path).stat().st_mtime_ns
+
+            second = list(build_wheel(self._wheel_meta(source_file), dist_path))[0]
+
+            self.assertEqual(first.checksum, second.checksum)
+            # the wheel file was not rewritten on the cached build
+            self.assertEqual(first_mtime, Path(second.file_path).stat().st_mtime_ns)
+
+    def test_rebuild_with_changed_source_invalidates_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_file = Path(temp_dir, "dummy")
+            source_file.write_bytes(b"#!/bin/sh\necho dummy\n")
+            dist_path = Path(temp_dir, "dist")
+
+            first = list(build_wheel(self._wheel_meta(source_file), dist_path))[0]
+
+            source_file.write_bytes(b"#!/bin/sh\necho changed\n")
+            second = list(build_wheel(self._wheel_meta(source_file), dist_path))[0]
+
+            self.assertNotEqual(first.checksum, second.checksum)
+
+    def test_rebuild_with_different_checksum_algo_invalidates_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_file = Path(temp_dir, "dummy")
+            source_file.write_bytes(b"#!/bin/sh\necho dummy\n")
+            dist_path = Path(temp_dir, "dist")
+
+            first = list(build_wheel(self._wheel_meta(source_file), dist_path))[0]
+            cache_content = json.loads(Path(dist_path, ".cache.json").read_text("utf-8"))
+            for cache_entry in cache_content.values():
+                # poison the recorded algorithm, the checksum must not be reused
+                cache_entry["algo"] = "other"
+            Path(dist_path, ".cache.json").write_text(json.dumps(cache_content), "utf-8")
+            first_mtime = Path(first.file_path).stat().st_mtime_ns
+
+            second = list(build_wheel(self._wheel_meta(source_file), dist_path))[0]
+
+            self.assertNotEqual(first_mtime, Path(second.file_path).stat().st_mtime_ns)
+
+    def test_corrupt_cache_file_leads_to_full_rebuild(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_file = Path(temp_dir, "dummy")
+            source_file.write_bytes(b"#!/bin/sh\necho dummy\n")
+            dist_path = Path(temp_dir, "dist")
+
+            first = list(build_wheel(self._wheel_meta(source_file), dist_path))[0]
+
+            Path(dist_path, ".cache.json").write_text("not json at all", "utf-8")
+            second = list(build_wheel(self._wheel_meta(source_file), dist_path))[0]
+
+            self.assertEqual(first.checksum, second.checksum)
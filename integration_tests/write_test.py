@@ -12,14 +12,14 @@ from integration_tests.util import verify_wheel_structure, install_wheel
 
 class WriteTest(unittest.TestCase):
     expected_checksums = {
-        'dummy-0.0.1-py3-none-win32.whl': 'd5a5aaf28374721ae0f257bd0bd799e13eba879e91e6de744a522363824de8a1',
-        'dummy-0.0.1-py3-none-win_amd64.whl': 'e7cec5b5784c6dde0097314beef784f6961c0d2a6c5e0df432fb921e85d59b09',
-        'dummy-0.0.1-py3-none-macosx_10_9_x86_64.whl': 'dc6f7d2116cc251622127816ee1a2e1a8cc8f1c0aa1629ed483fb740625494ab',
-        'dummy-0.0.1-py3-none-macosx_11_0_arm64.whl': 'cc924a8dedb73107437a49013b60b701c286047011c67ef89b633fa3b0064e4a',
-        'dummy-0.0.1-py3-none-manylinux_2_12_i686.manylinux2010_i686.whl': '18b27a6efce30286fa1b7bb79f09ad6a29ddcc210e615ed7d36c96b264328975',
-        'dummy-0.0.1-py3-none-manylinux_2_12_x86_64.manylinux2010_x86_64.whl': '88df741fa70fe4696858d4ec8861e8332be99094fdadc8c4a9ba0755ca87e5ae',
-        'dummy-0.0.1-py3-none-manylinux_2_17_armv7l.manylinux2014_armv7l.whl': '74116eacefbed07dea63c2e9af12326d49ac41b734cf2426d38a2e4ff235bcd6',
-        'dummy-0.0.1-py3-none-manylinux_2_17_aarch64.manylinux2014_aarch64.whl': '66dde6297c2460c8d461adbb016dbd7d451ca9e58f9a4da31026415228cd7a0f',
+        'dummy-0.0.1-py3-none-win32.whl': '701b76136d6e21dda2be68cc76a3b6991e64c0177e24aa9f39178474e44c828c',
+        'dummy-0.0.1-py3-none-win_amd64.whl': '3627c3618caa188115a52a9712d860bfab39a79190358510cc4d321cf4c352e3',
+        'dummy-0.0.1-py3-none-macosx_10_9_x86_64.whl': 'e92f1317c371dd88d5f52d0f54ea73eb72710ef53465df7b82f2a58f609f5d3b',
+        'dummy-0.0.1-py3-none-macosx_11_0_arm64.whl': '5eb35e9cadb12c4a50b86f5f9289929a756d47d5fd7091cb689e4631bea772bf',
+        'dummy-0.0.1-py3-none-manylinux_2_12_i686.manylinux2010_i686.whl': '2f3c84999169e6244f727eb314650482ab9e32e79384a516c8900e0bda36bcc1',
+        'dummy-0.0.1-py3-none-manylinux_2_12_x86_64.manylinux2010_x86_64.whl': '460d21e329d212c707126baca37711ceae2ef6c7452965e3bbebf9d39887eb47',
+        'dummy-0.0.1-py3-none-manylinux_2_17_armv7l.manylinux2014_armv7l.whl': 'ca53b42ac7d6e89cdc1eac70b57cc73510e1d2f3a1ac07f1894950bb704107b7',
+        'dummy-0.0.1-py3-none-manylinux_2_17_aarch64.manylinux2014_aarch64.whl': 'ca7294b2ca87ebcec882c6dbd8198a6d9dd948fa61d3f77075d0bc72cd32afae',
     }
 
     def test_idempotent_creation(self):